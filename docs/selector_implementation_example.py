@@ -123,31 +123,66 @@ class SelectorHelper:
     
     def __init__(self, page: Page):
         self.page = page
+        # Locators are lazy and re-resolve on every action, so they can be
+        # built once per selector string and reused for the page's lifetime
+        self._locator_cache: Dict[str, Locator] = {}
         
+    def locator(self, selector: str) -> Locator:
+        """
+        Get a cached locator for a selector string
+        
+        Args:
+            selector: CSS selector
+            
+        Returns:
+            Locator for the selector
+        """
+        locator = self._locator_cache.get(selector)
+        if locator is None:
+            locator = self.page.locator(selector)
+            self._locator_cache[selector] = locator
+        return locator
+        
+    def visible_locator(self, selectors: List[str]) -> Locator:
+        """
+        Get a cached locator for visible elements matching any of the selectors
+        
+        Args:
+            selectors: List of CSS selectors
+            
+        Returns:
+            Locator for the visible matches, in DOM order
+        """
+        return self.locator(f"{', '.join(selectors)} >> visible=true")
+    
     async def find_element(self, selectors: List[str], timeout: int = 5000) -> Optional[Locator]:
         """
-        Try multiple selectors until one is found
+        Find the first visible element matching any of the selectors
+        
+        All selectors are combined into a single CSS selector list, so one wait
+        covers every candidate instead of waiting on each selector in turn.
+        Hidden matches are skipped, and among the visible ones the first in
+        DOM order is returned (the order of ``selectors`` does not matter).
         
         Args:
             selectors: List of CSS selectors to try
-            timeout: Timeout per selector in milliseconds
+            timeout: Total timeout in milliseconds
             
         Returns:
             Locator if found, None otherwise
         """
-        for selector in selectors:
-            try:
-                element = self.page.locator(selector)
-                await element.wait_for(timeout=timeout)
-                if await element.is_visible():
-                    return element
-            except PlaywrightTimeoutError:
-                continue
-            except Exception as e:
-                print(f"Error with selector '{selector}': {e}")
-                continue
+        if not selectors:
+            return None
         
-        return None
+        element = self.visible_locator(selectors).first
+        try:
+            await element.wait_for(state="visible", timeout=timeout)
+            return element
+        except PlaywrightTimeoutError:
+            return None
+        except Exception as e:
+            print(f"Error with selectors {selectors}: {e}")
+            return None
     
     async def find_by_text(self, text: str, tag: str = "*", exact: bool = False) -> Optional[Locator]:
         """
@@ -167,26 +202,29 @@ class SelectorHelper:
             else:
                 selector = f'{tag}:text-matches("{text}", "i")'
             
-            element = self.page.locator(selector).first()
+            element = self.locator(selector).first
             await element.wait_for(timeout=3000)
             return element if await element.is_visible() else None
             
         except PlaywrightTimeoutError:
             return None
     
-    async def wait_for_response_complete(self, response_selectors: List[str], timeout: int = 30000) -> bool:
+    async def wait_for_response_complete(self, response_selectors: List[str], timeout: int = 30000,
+                                         response_area: Optional[Locator] = None) -> bool:
         """
         Wait for AI response to complete (streaming finished)
         
         Args:
             response_selectors: Selectors for response area
             timeout: Maximum wait time in milliseconds
+            response_area: Already located response area (skips the lookup)
             
         Returns:
             True if response completed, False if timeout
         """
         # First, find the response area
-        response_area = await self.find_element(response_selectors)
+        if response_area is None:
+            response_area = await self.find_element(response_selectors)
         if not response_area:
             return False
         
@@ -208,23 +246,26 @@ class SelectorHelper:
         except PlaywrightTimeoutError:
             return False
     
-    async def get_response_text(self, response_selectors: List[str]) -> Optional[str]:
+    async def get_response_text(self, response_selectors: List[str],
+                                response_area: Optional[Locator] = None) -> Optional[str]:
         """
         Get the latest response text
         
         Args:
             response_selectors: Selectors for response area
+            response_area: Already located response area (skips the lookup)
             
         Returns:
             Response text if found, None otherwise
         """
-        response_area = await self.find_element(response_selectors)
+        if response_area is None:
+            response_area = await self.find_element(response_selectors)
         if not response_area:
             return None
         
         try:
             # Get all message elements and return the last one
-            messages = response_area.locator('[data-message-author-role="assistant"]').last()
+            messages = response_area.locator('[data-message-author-role="assistant"]').last
             if await messages.count() > 0:
                 return await messages.text_content()
             
@@ -252,22 +293,23 @@ class AIServiceAutomator:
         Returns:
             True if logged in, False otherwise
         """
-        # Check for logged-in indicators first
         logged_in_selectors = self.selectors.get("logged_in_indicators", [])
+        login_selectors = self.selectors.get("login_indicators", [])
+        
+        # Wait for whichever indicator set appears first instead of checking
+        # them one after the other (one wait instead of two)
+        indicator = await self.helper.find_element(logged_in_selectors + login_selectors, timeout=2000)
+        if not indicator:
+            # If neither found, assume logged in
+            return True
+        
+        # Logged-in indicators take precedence when both are present
         if logged_in_selectors:
-            logged_in_element = await self.helper.find_element(logged_in_selectors, timeout=2000)
-            if logged_in_element:
+            logged_in_element = self.helper.visible_locator(logged_in_selectors).first
+            if await logged_in_element.is_visible():
                 return True
         
-        # Check for login required indicators
-        login_selectors = self.selectors.get("login_indicators", [])
-        if login_selectors:
-            login_element = await self.helper.find_element(login_selectors, timeout=2000)
-            if login_element:
-                return False
-        
-        # If neither found, assume logged in
-        return True
+        return False
     
     async def send_message(self, message: str) -> bool:
         """
@@ -329,14 +371,24 @@ class AIServiceAutomator:
             print(f"No response selectors defined for {self.service_name}")
             return None
         
+        # Locate the response area once and reuse it for both steps
+        response_area = await self.helper.find_element(response_selectors)
+        if not response_area:
+            print("Could not find response area")
+            return None
+        
         # Wait for response to complete
-        completed = await self.helper.wait_for_response_complete(response_selectors, timeout)
+        completed = await self.helper.wait_for_response_complete(
+            response_selectors, timeout, response_area=response_area
+        )
         if not completed:
             print("Response did not complete within timeout")
             return None
         
         # Get response text
-        response_text = await self.helper.get_response_text(response_selectors)
+        response_text = await self.helper.get_response_text(
+            response_selectors, response_area=response_area
+        )
         return response_text
     
     async def select_model(self, model_name: str) -> bool:
@@ -366,17 +418,18 @@ class AIServiceAutomator:
             # Wait for dropdown/menu to appear
             await self.page.wait_for_selector('[role="listbox"], [role="menu"], [role="combobox"]', timeout=5000)
             
-            # Look for the specific model
-            model_option = await self.helper.find_by_text(model_name, "button")
-            if not model_option:
-                model_option = await self.helper.find_by_text(model_name, "*")
-            
-            if model_option:
-                await model_option.click()
-                return True
-            else:
+            # Look for the specific model with a single lookup over all option-like
+            # elements, stopping at the first visible match instead of probing tag by tag
+            option_selectors = ['button', '[role="option"]', '[role="menuitem"]', '.model-option']
+            model_option = self.helper.visible_locator(option_selectors).filter(has_text=model_name).first
+            try:
+                await model_option.wait_for(timeout=3000)
+            except PlaywrightTimeoutError:
                 print(f"Could not find model option: {model_name}")
                 return False
+            
+            await model_option.click()
+            return True
                 
         except Exception as e:
             print(f"Error selecting model: {e}")
@@ -7,14 +7,22 @@ AI自動化ツールのグラフィカルユーザーインターフェース関
 __version__ = "1.0.0"
 __author__ = "担当者A"
 
-# 主要クラスのインポート
-from .main_window import MainWindow
-from .components import (
-    LabeledEntry, LabeledCombobox, CheckboxGroup, 
-    ProgressPanel, LogPanel, StatusBar, ButtonPanel
-)
-from .settings_dialog import SettingsDialog
-from .progress_window import ProgressWindow
+import importlib
+
+# 主要クラスと定義モジュールの対応
+# （サブモジュールは初回アクセス時に読み込み、不要なGUI部品の読み込みを避ける）
+_LAZY_IMPORTS = {
+    "MainWindow": ".main_window",
+    "LabeledEntry": ".components",
+    "LabeledCombobox": ".components",
+    "CheckboxGroup": ".components",
+    "ProgressPanel": ".components",
+    "LogPanel": ".components",
+    "StatusBar": ".components",
+    "ButtonPanel": ".components",
+    "SettingsDialog": ".settings_dialog",
+    "ProgressWindow": ".progress_window",
+}
 
 __all__ = [
     "MainWindow",
@@ -27,4 +35,19 @@ __all__ = [
     "ButtonPanel",
     "SettingsDialog",
     "ProgressWindow"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """主要クラスを初回アクセス時にインポート"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
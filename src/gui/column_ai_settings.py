@@ -6,11 +6,11 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Callable
 import json
 import copy
 
-from src.gui.components import LabeledCombobox, ValidationMixin
+from src.gui.components import LabeledCombobox, ValidationMixin, bind_scrollregion
 
 
 class AIModelConfig:
@@ -191,15 +191,57 @@ class AIModelConfig:
             }
         }
     }
+    
+    # AIサービス名の一覧（選択肢として各列で共有）
+    AI_SERVICES = list(AI_CONFIGS.keys())
 
 
 class ColumnAISettingsDialog:
     """列毎AI設定ダイアログ"""
     
-    def __init__(self, parent, config_manager, sheet_columns: List[str] = None):
+    # プリセットテンプレートの名前と説明（表示順）
+    PRESET_DESCRIPTIONS: List[Tuple[str, str]] = [
+        ("高性能モード", "最新の高性能モデルを各AIで選択"),
+        ("バランスモード", "性能とコストのバランスを重視"),
+        ("高速モード", "応答速度を重視した設定"),
+        ("研究モード", "詳細分析・研究向けの設定")
+    ]
+    
+    # プリセットテンプレートの設定内容
+    PRESET_TEMPLATES: Dict[str, Dict[str, str]] = {
+        "高性能モード": {
+            "ai_service": "chatgpt",
+            "model": "gpt-4.1",
+            "mode": "precise",
+            "feature": "deep_research"
+        },
+        "バランスモード": {
+            "ai_service": "claude",
+            "model": "claude-3.5-sonnet", 
+            "mode": "balanced",
+            "feature": "analysis"
+        },
+        "高速モード": {
+            "ai_service": "gemini",
+            "model": "gemini-2.0-flash",
+            "mode": "balanced",
+            "feature": "multimodal"
+        },
+        "研究モード": {
+            "ai_service": "perplexity",
+            "model": "claude-sonnet-4",
+            "mode": "research",
+            "feature": "deep_research"
+        }
+    }
+    
+    def __init__(self, parent, config_manager, sheet_columns: List[str] = None,
+                 reload_columns_callback: Optional[Callable[[], List[str]]] = None):
         self.parent = parent
         self.config_manager = config_manager
         self.sheet_columns = sheet_columns or ["A", "B", "C", "D", "E"]
+        # スプレッドシートから列を再検出するコールバック（省略時は再読込ボタンなし）
+        self.reload_columns_callback = reload_columns_callback
         
         # 既存設定の読み込み
         self.column_settings = copy.deepcopy(
@@ -285,10 +327,7 @@ class ColumnAISettingsDialog:
         scrollbar = ttk.Scrollbar(self.column_tab, orient="vertical", command=canvas.yview)
         self.scrollable_frame = ttk.Frame(canvas)
         
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        bind_scrollregion(canvas, self.scrollable_frame)
         
         canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -331,8 +370,7 @@ class ColumnAISettingsDialog:
         ttk.Label(row_frame, text=f"{column}列", width=6).grid(row=0, column=0, padx=(0, 10))
         
         # AIサービス選択
-        ai_services = list(AIModelConfig.AI_CONFIGS.keys())
-        ai_service_combo = ttk.Combobox(row_frame, values=ai_services, state="readonly", width=15)
+        ai_service_combo = ttk.Combobox(row_frame, values=AIModelConfig.AI_SERVICES, state="readonly", width=15)
         ai_service_combo.grid(row=0, column=1, padx=(0, 10))
         ai_service_combo.bind("<<ComboboxSelected>>", lambda e, col=column: self.on_ai_service_changed(col))
         
@@ -411,14 +449,7 @@ class ColumnAISettingsDialog:
         preset_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(0, 20))
         preset_frame.columnconfigure(0, weight=1)
         
-        presets = [
-            ("高性能モード", "最新の高性能モデルを各AIで選択"),
-            ("バランスモード", "性能とコストのバランスを重視"),
-            ("高速モード", "応答速度を重視した設定"),
-            ("研究モード", "詳細分析・研究向けの設定")
-        ]
-        
-        for i, (name, desc) in enumerate(presets):
+        for i, (name, desc) in enumerate(self.PRESET_DESCRIPTIONS):
             preset_row = ttk.Frame(preset_frame)
             preset_row.grid(row=i, column=0, sticky=(tk.W, tk.E), pady=2)
             preset_row.columnconfigure(0, weight=1)
@@ -430,34 +461,7 @@ class ColumnAISettingsDialog:
                       
     def apply_preset_template(self, preset_name: str):
         """プリセットテンプレートを適用"""
-        templates = {
-            "高性能モード": {
-                "ai_service": "chatgpt",
-                "model": "gpt-4.1",
-                "mode": "precise",
-                "feature": "deep_research"
-            },
-            "バランスモード": {
-                "ai_service": "claude",
-                "model": "claude-3.5-sonnet", 
-                "mode": "balanced",
-                "feature": "analysis"
-            },
-            "高速モード": {
-                "ai_service": "gemini",
-                "model": "gemini-2.0-flash",
-                "mode": "balanced",
-                "feature": "multimodal"
-            },
-            "研究モード": {
-                "ai_service": "perplexity",
-                "model": "claude-sonnet-4",
-                "mode": "research",
-                "feature": "deep_research"
-            }
-        }
-        
-        template = templates.get(preset_name)
+        template = self.PRESET_TEMPLATES.get(preset_name)
         if template:
             for column in self.sheet_columns:
                 self.apply_template_to_column(column, template)
@@ -535,14 +539,14 @@ class ColumnAISettingsDialog:
         self.preview_text.config(state="normal")
         self.preview_text.delete(1.0, tk.END)
         
-        preview_content = "=== 列毎AI設定プレビュー ===\n\n"
+        # 文字列の連結を繰り返さず、行をまとめてから1回で結合
+        lines = ["=== 列毎AI設定プレビュー ===", ""]
         for column, settings in preview_data.items():
-            preview_content += f"【{column}】\n"
-            for key, value in settings.items():
-                preview_content += f"  {key}: {value}\n"
-            preview_content += "\n"
+            lines.append(f"【{column}】")
+            lines.extend(f"  {key}: {value}" for key, value in settings.items())
+            lines.append("")
             
-        self.preview_text.insert(tk.END, preview_content)
+        self.preview_text.insert(tk.END, "\n".join(lines) + "\n")
         self.preview_text.config(state="disabled")
         
     def create_button_frame(self, parent):
@@ -556,6 +560,23 @@ class ColumnAISettingsDialog:
         ttk.Button(button_frame, text="キャンセル", command=self.cancel, width=10).grid(row=0, column=3, padx=(0, 5))
         ttk.Button(button_frame, text="リセット", command=self.reset_settings, width=10).grid(row=0, column=4)
         
+        if self.reload_columns_callback:
+            ttk.Button(button_frame, text="列を再読込", command=self.reload_columns,
+                      width=12).grid(row=0, column=5, padx=(5, 0))
+        
+    def reload_columns(self):
+        """スプレッドシートから列を再検出し、列設定ウィジェットを作り直す"""
+        # 入力中の設定は保持したまま作り直す
+        self._collect_column_settings()
+        
+        self.sheet_columns = self.reload_columns_callback() or self.sheet_columns
+        
+        for child in self.scrollable_frame.winfo_children():
+            child.destroy()
+        self.column_widgets = {}
+        self.create_column_setting_widgets()
+        self.load_settings()
+        
     def load_settings(self):
         """既存設定を読み込み"""
         for column in self.sheet_columns:
@@ -574,23 +595,27 @@ class ColumnAISettingsDialog:
                     widgets["mode"].set(settings.get("mode", ""))
                     widgets["feature"].set(settings.get("feature", ""))
                     
+    def _collect_column_settings(self):
+        """列設定ウィジェットの入力内容を column_settings に反映"""
+        for column in self.sheet_columns:
+            widgets = self.column_widgets[column]
+            ai_service = widgets["ai_service"].get()
+            
+            if ai_service:
+                self.column_settings[column] = {
+                    "ai_service": ai_service,
+                    "model": widgets["model"].get(),
+                    "mode": widgets["mode"].get(),
+                    "feature": widgets["feature"].get()
+                }
+            elif column in self.column_settings:
+                del self.column_settings[column]
+                    
     def save_settings(self) -> bool:
         """設定を保存"""
         try:
             # 設定を収集
-            for column in self.sheet_columns:
-                widgets = self.column_widgets[column]
-                ai_service = widgets["ai_service"].get()
-                
-                if ai_service:
-                    self.column_settings[column] = {
-                        "ai_service": ai_service,
-                        "model": widgets["model"].get(),
-                        "mode": widgets["mode"].get(),
-                        "feature": widgets["feature"].get()
-                    }
-                elif column in self.column_settings:
-                    del self.column_settings[column]
+            self._collect_column_settings()
             
             # 設定を検証
             from src.utils.column_validation import validate_column_ai_settings
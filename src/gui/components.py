@@ -7,9 +7,15 @@ GUI部品モジュール
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from typing import Dict, List, Any, Optional, Callable
+from datetime import datetime
 import re
 
 
+# 入力検証用の正規表現（呼び出しごとの解析を避けるため事前にコンパイル）
+_SHEETS_URL_PATTERN = re.compile(r'https://docs\.google\.com/spreadsheets/d/[a-zA-Z0-9-_]+')
+_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+
 class ValidationMixin:
     """入力検証用のミックスインクラス"""
     
@@ -20,14 +26,12 @@ class ValidationMixin:
             return False
         
         # Google SheetsのURL形式をチェック
-        pattern = r'https://docs\.google\.com/spreadsheets/d/[a-zA-Z0-9-_]+'
-        return bool(re.match(pattern, url))
+        return bool(_SHEETS_URL_PATTERN.match(url))
     
     @staticmethod
     def validate_email(email: str) -> bool:
         """メールアドレスの妥当性を検証"""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+        return bool(_EMAIL_PATTERN.match(email))
     
     @staticmethod
     def validate_required(value: str) -> bool:
@@ -176,12 +180,14 @@ class CheckboxGroup(ttk.Frame):
         row_count = 0
         col_count = 0
         
+        default_keys = set(default_selected) if default_selected else set()
+        
         for key, display_name in options.items():
             var = tk.BooleanVar()
             self.vars[key] = var
             
             # デフォルト選択設定
-            if default_selected and key in default_selected:
+            if key in default_keys:
                 var.set(True)
                 
             checkbox = ttk.Checkbutton(group_frame, text=display_name, variable=var)
@@ -212,8 +218,10 @@ class CheckboxGroup(ttk.Frame):
         
     def set_selected(self, selected: List[str]):
         """選択状態を設定"""
+        # 選択肢が多い場合に備え、所属判定は集合で行う
+        selected_keys = set(selected)
         for key, var in self.vars.items():
-            var.set(key in selected)
+            var.set(key in selected_keys)
             
     def select_all(self):
         """全て選択"""
@@ -327,10 +335,8 @@ class LogPanel(ttk.Frame):
         
     def add_log(self, level: str, message: str, timestamp: bool = True):
         """ログメッセージを追加"""
-        import datetime
-        
         if timestamp:
-            time_str = datetime.datetime.now().strftime("%H:%M:%S")
+            time_str = datetime.now().strftime("%H:%M:%S")
             log_message = f"[{time_str}] {level}: {message}\n"
         else:
             log_message = f"{level}: {message}\n"
@@ -438,6 +444,33 @@ class ButtonPanel(ttk.Frame):
             button.config(state="disabled")
 
 
+def bind_scrollregion(canvas: tk.Canvas, frame: tk.Widget):
+    """
+    フレームのサイズ変更に合わせてキャンバスのスクロール範囲を更新
+    
+    子ウィジェットを大量に配置すると <Configure> が連続して発生するため、
+    アイドル時に1回だけ bbox("all") を計算するようまとめる。
+    
+    Args:
+        canvas: スクロール対象のキャンバス
+        frame: キャンバス内に配置したフレーム
+    """
+    pending = False
+    
+    def update_scrollregion():
+        nonlocal pending
+        pending = False
+        canvas.configure(scrollregion=canvas.bbox("all"))
+        
+    def on_configure(event):
+        nonlocal pending
+        if not pending:
+            pending = True
+            canvas.after_idle(update_scrollregion)
+            
+    frame.bind("<Configure>", on_configure)
+
+
 def setup_styles():
     """スタイル設定"""
     style = ttk.Style()
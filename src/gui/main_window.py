@@ -7,7 +7,8 @@ AI自動化ツールのメインユーザーインターフェースを提供し
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
 from tkinter.messagebox import showerror, showinfo
-from typing import List, Dict, Callable, Optional
+from typing import List, Dict, Callable, Optional, Tuple
+from datetime import datetime
 import threading
 import os
 import sys
@@ -20,6 +21,17 @@ from src.utils.config_manager import config_manager
 from src.utils.logger import logger
 
 
+# AIサービス名と画面表示名の対応
+AI_DISPLAY_NAMES: Dict[str, str] = {
+    "chatgpt": "ChatGPT",
+    "claude": "Claude",
+    "gemini": "Gemini",
+    "genspark": "Genspark",
+    "google_ai_studio": "Google AI Studio",
+    "perplexity": "Perplexity AI"
+}
+
+
 class MainWindow:
     """メインGUIウィンドウクラス"""
     
@@ -36,6 +48,9 @@ class MainWindow:
         self.get_sheet_names_callback: Optional[Callable[[str], List[str]]] = None
         self.start_automation_callback: Optional[Callable[[Dict, Callable], None]] = None
         
+        # 検出済み「コピー」列のキャッシュ（キー: (スプレッドシートURL, シート名)）
+        self._sheet_columns_cache: Dict[Tuple[str, str], List[str]] = {}
+        
         # GUI部品の参照
         self.spreadsheet_url_var = tk.StringVar()
         self.sheet_name_var = tk.StringVar()
@@ -43,6 +58,10 @@ class MainWindow:
         self.progress_var = tk.DoubleVar()
         self.progress_text_var = tk.StringVar(value="待機中...")
         
+        # 対象のスプレッドシート・シートが変わったら列キャッシュを破棄
+        self.spreadsheet_url_var.trace_add("write", self._clear_sheet_columns_cache)
+        self.sheet_name_var.trace_add("write", self._clear_sheet_columns_cache)
+        
         self.setup_ui()
         self.load_settings()
         
@@ -127,15 +146,7 @@ class MainWindow:
         
         for ai_name, ai_config in ai_configs.items():
             # 表示名を日本語に変換
-            display_names = {
-                "chatgpt": "ChatGPT",
-                "claude": "Claude",
-                "gemini": "Gemini",
-                "genspark": "Genspark",
-                "google_ai_studio": "Google AI Studio",
-                "perplexity": "Perplexity AI"
-            }
-            display_name = display_names.get(ai_name, ai_name.title())
+            display_name = AI_DISPLAY_NAMES.get(ai_name, ai_name.title())
             
             var = tk.BooleanVar()
             self.ai_selection_vars[ai_name] = var
@@ -290,6 +301,9 @@ class MainWindow:
             messagebox.showwarning("警告", "スプレッドシートURLを入力してください。")
             return
             
+        # シート名を取り直す際はシート内容も変わっている可能性があるため列キャッシュを破棄
+        self._sheet_columns_cache.clear()
+            
         try:
             # 他モジュールのコールバック関数を呼び出し
             if self.get_sheet_names_callback:
@@ -398,7 +412,11 @@ class MainWindow:
             else:
                 # シンプル選択モードの場合（従来の処理）
                 if self.start_automation_callback:
-                    self.start_automation_callback(config, self.update_progress_callback)
+                    # Tkは別スレッドから操作できないため、進捗更新はメインスレッドに渡す
+                    def progress_callback(current, total, message=""):
+                        self.root.after(0, self.update_progress_callback, current, total, message)
+                        
+                    self.start_automation_callback(config, progress_callback)
                 else:
                     # 開発用のダミー処理
                     import time
@@ -519,8 +537,7 @@ class MainWindow:
         
     def add_log(self, level: str, message: str):
         """ログを追加"""
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+        timestamp = datetime.now().strftime("%H:%M:%S")
         log_message = f"[{timestamp}] {level}: {message}\n"
         
         # ログテキストエリアに追加
@@ -562,7 +579,10 @@ class MainWindow:
             sheet_columns = self.get_sheet_columns()
             
             from src.gui.column_ai_settings import ColumnAISettingsDialog
-            dialog = ColumnAISettingsDialog(self.root, self.config, sheet_columns)
+            dialog = ColumnAISettingsDialog(
+                self.root, self.config, sheet_columns,
+                reload_columns_callback=lambda: self.get_sheet_columns(refresh=True)
+            )
             self.root.wait_window(dialog.dialog)
             
             # 設定状況を更新
@@ -573,8 +593,17 @@ class MainWindow:
         except Exception as e:
             messagebox.showerror("エラー", f"列毎設定ダイアログを開けませんでした: {e}")
             
-    def get_sheet_columns(self) -> List[str]:
-        """スプレッドシートの列情報を取得"""
+    def _clear_sheet_columns_cache(self, *args):
+        """検出済み「コピー」列のキャッシュを破棄"""
+        self._sheet_columns_cache.clear()
+        
+    def get_sheet_columns(self, refresh: bool = False) -> List[str]:
+        """
+        スプレッドシートの列情報を取得
+        
+        Args:
+            refresh: Trueの場合はキャッシュを使わずスプレッドシートから再検出する
+        """
         try:
             # 実際のスプレッドシートから「コピー」列を検出
             spreadsheet_url = self.spreadsheet_url_var.get().strip()
@@ -584,6 +613,14 @@ class MainWindow:
                 # スプレッドシート情報が不完全な場合はデフォルト
                 return ["C", "D", "E", "F", "G", "H", "I", "J"]
             
+            # 同じシートで検出済みであれば、スプレッドシートを再読み込みしない
+            cache_key = (spreadsheet_url, sheet_name)
+            if refresh:
+                self._sheet_columns_cache.pop(cache_key, None)
+            cached_columns = self._sheet_columns_cache.get(cache_key)
+            if cached_columns is not None:
+                return list(cached_columns)
+            
             # DataHandlerを使用して実際の「コピー」列を検出
             from src.sheets.sheets_client import create_sheets_client
             from src.sheets.data_handler import DataHandler
@@ -610,7 +647,8 @@ class MainWindow:
                 # 実際の「コピー」列を列記号に変換
                 column_letters = [column_number_to_letter(col) for col in copy_columns]
                 self.add_log("INFO", f"検出された「コピー」列: {column_letters}")
-                return column_letters
+                self._sheet_columns_cache[cache_key] = column_letters
+                return list(column_letters)
             else:
                 # 「コピー」列が見つからない場合は一般的な位置を提案
                 suggested_columns = ["C", "E", "G", "I"]  # C列から奇数列
@@ -634,10 +672,11 @@ class MainWindow:
             
             def refresh_thread():
                 try:
-                    from src.utils.playwright_search import search_ai_models_sync
+                    from src.utils.playwright_search import (
+                        search_ai_models_sync, SUPPORTED_AI_SERVICES
+                    )
                     
-                    ai_services = ["chatgpt", "claude", "gemini", "perplexity", "genspark"]
-                    results = search_ai_models_sync(ai_services, headless=True)
+                    results = search_ai_models_sync(list(SUPPORTED_AI_SERVICES), headless=True)
                     
                     self.root.after(0, self._on_ai_info_refreshed, results)
                     
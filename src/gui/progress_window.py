@@ -15,6 +15,10 @@ from enum import Enum
 from src.gui.components import ProgressPanel, LogPanel, StatusBar
 
 
+# タスク一覧・統計の再描画間隔（ミリ秒）。更新が頻繁でも描画はこの間隔にまとめる
+REDRAW_INTERVAL_MS = 250
+
+
 class TaskStatus(Enum):
     """タスクステータス列挙型"""
     PENDING = "待機中"
@@ -80,9 +84,12 @@ class ProgressWindow:
         self.setup_window()
         self.setup_ui()
         
-        # 更新タイマー
+        # 再描画の予約（複数の更新を1回の描画にまとめる）
+        self._redraw_after_id: Optional[str] = None
+        
+        # 更新タイマー（処理中のみ動作させ、待機中に定期処理を走らせない）
         self.update_timer_active = False
-        self.start_update_timer()
+        self._timer_after_id: Optional[str] = None
         
     def setup_window(self):
         """ウィンドウの基本設定"""
@@ -290,7 +297,7 @@ class ProgressWindow:
     def add_task(self, task_info: TaskInfo):
         """タスクを追加"""
         self.tasks[task_info.task_id] = task_info
-        self.update_task_tree()
+        self.schedule_redraw()
         
     def update_task_status(self, task_id: str, status: TaskStatus, 
                           result_preview: str = None, error_message: str = None):
@@ -319,7 +326,23 @@ class ProgressWindow:
         # ログ出力
         self.log_task_status_change(task, old_status, status)
         
-        # UI更新
+        # UI更新（イベントごとには描画せず、一定間隔でまとめて反映）
+        self.schedule_redraw()
+        
+    def schedule_redraw(self):
+        """タスク一覧と統計の再描画を予約"""
+        if self._redraw_after_id is None:
+            self._redraw_after_id = self.window.after(REDRAW_INTERVAL_MS, self.flush_redraw)
+            
+    def cancel_redraw(self):
+        """予約された再描画を取り消す"""
+        if self._redraw_after_id is not None:
+            self.window.after_cancel(self._redraw_after_id)
+            self._redraw_after_id = None
+            
+    def flush_redraw(self):
+        """予約された再描画を直ちに実行"""
+        self.cancel_redraw()
         self.update_task_tree()
         self.update_statistics()
         
@@ -338,51 +361,53 @@ class ProgressWindow:
             
     def update_task_tree(self):
         """タスクツリーを更新"""
-        # 既存項目をクリア
-        for item in self.task_tree.get_children():
-            self.task_tree.delete(item)
-            
-        # タスクを追加
+        # 項目IDにtask_idを使い、既存項目は削除せずにその場で更新する
         for task in self.tasks.values():
-            status_text = task.status.value
-            duration_text = task.display_duration
+            values = (
+                task.row_number,
+                task.ai_service,
+                task.status.value,
+                task.display_duration,
+                task.text_preview
+            )
             
             # タグ（色分け用）
             tag = task.status.name.lower()
             
-            # ツリーに挿入
-            item = self.task_tree.insert("", "end", values=(
-                task.row_number,
-                task.ai_service,
-                status_text,
-                duration_text,
-                task.text_preview
-            ), tags=(tag,))
+            if self.task_tree.exists(task.task_id):
+                self.task_tree.item(task.task_id, values=values, tags=(tag,))
+            else:
+                self.task_tree.insert("", "end", iid=task.task_id, values=values, tags=(tag,))
             
     def update_statistics(self):
         """統計情報を更新"""
         if not self.tasks:
             return
             
-        # 各ステータスの数を計算
+        # 各ステータスの数と完了タスクの処理時間を1回の走査で集計
         status_counts = {status: 0 for status in TaskStatus}
+        duration_total = 0.0
+        duration_count = 0
         for task in self.tasks.values():
             status_counts[task.status] += 1
-            
+            if task.status == TaskStatus.COMPLETED:
+                duration = task.duration
+                if duration is not None:
+                    duration_total += duration
+                    duration_count += 1
+
         total_tasks = len(self.tasks)
         completed = status_counts[TaskStatus.COMPLETED]
         errors = status_counts[TaskStatus.ERROR]
         remaining = total_tasks - completed - errors - status_counts[TaskStatus.SKIPPED]
-        
+
         # 進捗パネル更新
         self.progress_panel.update_progress(completed, total_tasks)
         self.progress_panel.update_details(completed, remaining, errors)
-        
+
         # 平均処理時間計算
-        completed_tasks = [t for t in self.tasks.values() 
-                          if t.status == TaskStatus.COMPLETED and t.duration is not None]
-        if completed_tasks:
-            avg_duration = sum(t.duration for t in completed_tasks) / len(completed_tasks)
+        if duration_count:
+            avg_duration = duration_total / duration_count
             self.avg_time_var.set(f"{avg_duration:.1f}秒")
             
             # 予想残り時間計算
@@ -413,6 +438,7 @@ class ProgressWindow:
         self.is_running = True
         self.start_time = datetime.now()
         self.start_time_var.set(self.start_time.strftime("%H:%M:%S"))
+        self.start_update_timer()
         
         # ボタン状態更新
         self.pause_button.config(text="一時停止", state="normal")
@@ -424,6 +450,8 @@ class ProgressWindow:
         """処理停止"""
         self.is_running = False
         self.end_time = datetime.now()
+        self.stop_update_timer()
+        self.flush_redraw()
         
         # ボタン状態更新
         self.pause_button.config(text="一時停止", state="disabled")
@@ -496,16 +524,8 @@ class ProgressWindow:
         if not selection:
             return
             
-        item = selection[0]
-        values = self.task_tree.item(item, "values")
-        row_number = int(values[0])
-        
-        # 該当タスクを検索
-        task = None
-        for t in self.tasks.values():
-            if t.row_number == row_number:
-                task = t
-                break
+        # 項目IDはtask_idなので、辞書から直接取得
+        task = self.tasks.get(selection[0])
                 
         if task:
             self.show_task_detail_dialog(task)
@@ -570,15 +590,21 @@ class ProgressWindow:
         
     def start_update_timer(self):
         """更新タイマー開始"""
+        if self.update_timer_active:
+            return
         self.update_timer_active = True
         self.update_timer()
         
     def stop_update_timer(self):
         """更新タイマー停止"""
         self.update_timer_active = False
-        
+        if self._timer_after_id is not None:
+            self.window.after_cancel(self._timer_after_id)
+            self._timer_after_id = None
+            
     def update_timer(self):
         """定期更新処理"""
+        self._timer_after_id = None
         if not self.update_timer_active:
             return
             
@@ -590,7 +616,7 @@ class ProgressWindow:
             self.elapsed_time_var.set(f"{int(hours):02d}:{int(minutes):02d}:{int(seconds):02d}")
             
         # 次回更新をスケジュール
-        self.window.after(1000, self.update_timer)
+        self._timer_after_id = self.window.after(1000, self.update_timer)
         
     def on_window_close(self):
         """ウィンドウ閉じる時の処理"""
@@ -598,9 +624,11 @@ class ProgressWindow:
             from tkinter import messagebox
             if messagebox.askokcancel("確認", "処理中です。ウィンドウを閉じますか？"):
                 self.stop_update_timer()
+                self.cancel_redraw()
                 self.window.destroy()
         else:
             self.stop_update_timer()
+            self.cancel_redraw()
             self.window.destroy()
             
     def set_cancel_callback(self, callback: Callable):
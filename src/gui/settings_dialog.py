@@ -12,7 +12,7 @@ import os
 from pathlib import Path
 
 from src.gui.components import (
-    LabeledEntry, LabeledCombobox, ValidationMixin, TooltipMixin
+    LabeledEntry, LabeledCombobox, ValidationMixin, TooltipMixin, bind_scrollregion
 )
 
 
@@ -158,10 +158,7 @@ class SettingsDialog(ValidationMixin, TooltipMixin):
         scrollbar = ttk.Scrollbar(tab_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        bind_scrollregion(canvas, scrollable_frame)
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
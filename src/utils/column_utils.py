@@ -56,6 +56,15 @@ def column_number_to_letter(column_number: int) -> str:
     if column_number < 1:
         raise ValueError(f"列番号は1以上である必要があります: {column_number}")
     
+    # A〜ZZ列は事前計算済みのテーブルから取得
+    if column_number <= len(_COLUMN_LETTERS):
+        return _COLUMN_LETTERS[column_number - 1]
+    
+    return _calculate_column_letter(column_number)
+
+
+def _calculate_column_letter(column_number: int) -> str:
+    """列番号から列記号を計算（テーブル範囲外の列用）"""
     result = ""
     while column_number > 0:
         column_number -= 1
@@ -64,6 +73,10 @@ def column_number_to_letter(column_number: int) -> str:
     return result
 
 
+# A〜ZZ列（1〜702列）の列記号テーブル（インデックス0がA列）
+_COLUMN_LETTERS: List[str] = [_calculate_column_letter(i) for i in range(1, 26 * 27 + 1)]
+
+
 def get_copy_column_positions(copy_column: int) -> Tuple[int, int, int, int]:
     """
     「コピー」列を基準とした関連列の位置を計算
@@ -153,7 +166,12 @@ def find_copy_columns_in_header(header_row: List[str]) -> List[Tuple[int, str]]:
     copy_columns = []
     
     for i, cell_value in enumerate(header_row):
-        if cell_value and str(cell_value).strip() == "コピー":
+        if not cell_value:
+            continue
+        # Sheetsのセル値は通常strなので、その場合は str() による変換を省く
+        if not isinstance(cell_value, str):
+            cell_value = str(cell_value)
+        if cell_value.strip() == "コピー":
             column_number = i + 1  # 1ベース
             column_letter = column_number_to_letter(column_number)
             copy_columns.append((column_number, column_letter))
@@ -144,7 +144,8 @@ class ColumnConfigValidator:
     
     def _validate_column_positions(self, column_settings: Dict[str, Any]):
         """列位置の重複チェック"""
-        column_numbers = []
+        # 登録済みの列番号（重複判定をO(1)で行うため集合で保持）
+        column_numbers = set()
         
         for column_key in column_settings.keys():
             try:
@@ -161,7 +162,7 @@ class ColumnConfigValidator:
                         error_code="DUPLICATE_COLUMN"
                     ))
                 else:
-                    column_numbers.append(column_number)
+                    column_numbers.add(column_number)
                     
             except ValueError:
                 continue  # 既に他の検証でエラーが出ているはず
@@ -259,9 +260,13 @@ class ColumnConfigValidator:
     
     def get_summary(self) -> Dict[str, Any]:
         """検証結果のサマリーを取得"""
-        error_count = len([r for r in self.validation_results if r.level == ValidationLevel.ERROR])
-        warning_count = len([r for r in self.validation_results if r.level == ValidationLevel.WARNING])
-        info_count = len([r for r in self.validation_results if r.level == ValidationLevel.INFO])
+        level_counts = {level: 0 for level in ValidationLevel}
+        for result in self.validation_results:
+            level_counts[result.level] += 1
+        
+        error_count = level_counts[ValidationLevel.ERROR]
+        warning_count = level_counts[ValidationLevel.WARNING]
+        info_count = level_counts[ValidationLevel.INFO]
         
         return {
             "total_issues": len(self.validation_results),
@@ -305,9 +310,8 @@ class ColumnConfigValidator:
             for result in infos:
                 lines.append(f"  • {result.message}")
         
-        # サマリー
-        summary = self.get_summary()
-        lines.append(f"\n📊 サマリー: エラー{summary['error_count']}件、警告{summary['warning_count']}件")
+        # サマリー（振り分け済みのリストから件数を取得し、再走査しない）
+        lines.append(f"\n📊 サマリー: エラー{len(errors)}件、警告{len(warnings)}件")
         
         return "\n".join(lines)
 
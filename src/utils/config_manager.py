@@ -6,6 +6,8 @@
 
 import json
 import os
+import stat
+import uuid
 from pathlib import Path
 from typing import Dict, Any, Optional
 from src.utils.logger import logger
@@ -36,13 +38,13 @@ class ConfigManager:
             if self.config_path.exists():
                 with open(self.config_path, 'r', encoding='utf-8') as f:
                     self.config_data = json.load(f)
-                logger.info(f"設定ファイルを読み込みました: {self.config_path}")
+                logger.info("設定ファイルを読み込みました: %s", self.config_path)
             else:
-                logger.warning(f"設定ファイルが見つかりません: {self.config_path}")
+                logger.warning("設定ファイルが見つかりません: %s", self.config_path)
                 self.config_data = self._get_default_config()
                 self.save_config()
         except Exception as e:
-            logger.error(f"設定ファイルの読み込みに失敗しました: {e}")
+            logger.error("設定ファイルの読み込みに失敗しました: %s", e)
             self.config_data = self._get_default_config()
         
         return self.config_data
@@ -58,15 +60,40 @@ class ConfigManager:
             # ディレクトリが存在しない場合は作成
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config_data, f, ensure_ascii=False, indent=2)
+            # 一時ファイルに書き出してから置き換え、書き込み途中の設定ファイルが残らないようにする
+            # 作成時のパーミッションは 0666 を指定し、umask の適用はOSに任せる
+            tmp_path = self.config_path.parent / f".{self.config_path.name}.{uuid.uuid4().hex}.tmp"
+            fd = os.open(tmp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, 'O_BINARY', 0), 0o666)
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(self.config_data, f, ensure_ascii=False, indent=2)
+                self._copy_existing_file_mode(tmp_path)
+                os.replace(tmp_path, self.config_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
             
-            logger.info(f"設定ファイルを保存しました: {self.config_path}")
+            logger.info("設定ファイルを保存しました: %s", self.config_path)
             return True
         except Exception as e:
-            logger.error(f"設定ファイルの保存に失敗しました: {e}")
+            logger.error("設定ファイルの保存に失敗しました: %s", e)
             return False
     
+    def _copy_existing_file_mode(self, tmp_path: Path):
+        """
+        既存の設定ファイルの権限を一時ファイルに引き継ぐ
+        
+        Args:
+            tmp_path (Path): 置き換え前の一時ファイルのパス
+        """
+        try:
+            mode = stat.S_IMODE(os.stat(self.config_path).st_mode)
+        except FileNotFoundError:
+            # 新規作成時は作成時に適用された umask 準拠の権限のままにする
+            return
+        os.chmod(tmp_path, mode)
+    
     def get(self, key: str, default: Any = None) -> Any:
         """
         設定値を取得
@@ -87,7 +114,7 @@ class ConfigManager:
             
             return value
         except (KeyError, TypeError):
-            logger.debug(f"設定キーが見つかりません: {key}")
+            logger.debug("設定キーが見つかりません: %s", key)
             return default
     
     def set(self, key: str, value: Any) -> bool:
@@ -113,10 +140,10 @@ class ConfigManager:
             
             # 最後のキーに値を設定
             target[keys[-1]] = value
-            logger.info(f"設定を更新しました: {key} = {value}")
+            logger.info("設定を更新しました: %s = %s", key, value)
             return True
         except Exception as e:
-            logger.error(f"設定の更新に失敗しました: {key} = {value}, エラー: {e}")
+            logger.error("設定の更新に失敗しました: %s = %s, エラー: %s", key, value, e)
             return False
     
     def _get_default_config(self) -> Dict[str, Any]:
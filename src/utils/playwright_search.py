@@ -13,11 +13,88 @@ from pathlib import Path
 
 try:
     from playwright.async_api import async_playwright, Browser, Page, BrowserContext
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
     logging.warning("Playwright not installed. Web search functionality will be limited.")
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+# ページ本文の描画待機の上限（ミリ秒）。見出しが無いページでも従来の固定待機（2秒）より長くしない
+CONTENT_READY_TIMEOUT = 2000
+
+# 一括検索時に同時に検索するAIサービス数の上限
+MAX_CONCURRENT_SEARCHES = 3
+
+# ブラウザ起動時の引数
+BROWSER_LAUNCH_ARGS = (
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-extensions',
+    '--disable-plugins',
+    # 画像読み込み無効化で高速化（--disable-images はChromiumに存在しないフラグ）
+    '--blink-settings=imagesEnabled=false',
+)
+
+# ブラウザコンテキストの設定
+BROWSER_CONTEXT_OPTIONS: Dict[str, Any] = {
+    "user_agent": 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    "viewport": {'width': 1280, 'height': 720},
+    "java_script_enabled": True,
+}
+
+# テキスト抽出に不要なため読み込まないリソース種別
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+# AIサービスごとの検索対象URLと検索キーワード
+SEARCH_CONFIGS: Dict[str, Dict[str, List[str]]] = {
+    "chatgpt": {
+        "urls": [
+            "https://platform.openai.com/docs/models",
+            "https://chat.openai.com"
+        ],
+        "search_terms": ["GPT-4", "GPT-4o", "GPT-4.1", "models", "latest"]
+    },
+    "claude": {
+        "urls": [
+            "https://docs.anthropic.com/en/docs/about-claude/models",
+            "https://claude.ai"
+        ],
+        "search_terms": ["Claude 3.5", "Sonnet", "Haiku", "models", "latest"]
+    },
+    "gemini": {
+        "urls": [
+            "https://ai.google.dev/gemini-api/docs/models",
+            "https://gemini.google.com"
+        ],
+        "search_terms": ["Gemini 2.0", "Flash", "Pro", "models", "latest"]
+    },
+    "perplexity": {
+        "urls": [
+            "https://www.perplexity.ai",
+            "https://docs.perplexity.ai"
+        ],
+        "search_terms": ["models", "Pro", "search modes", "latest"]
+    },
+    "genspark": {
+        "urls": [
+            "https://genspark.ai",
+            "https://www.genspark.ai"
+        ],
+        "search_terms": ["models", "Sparkpage", "features", "latest"]
+    }
+}
+
+# 検索に対応しているAIサービス名の一覧
+SUPPORTED_AI_SERVICES = tuple(SEARCH_CONFIGS)
+
 
 class PlaywrightSearcher:
     """Playwright検索クラス"""
@@ -54,28 +131,27 @@ class PlaywrightSearcher:
             self.playwright = await async_playwright().start()
             self.browser = await self.playwright.chromium.launch(
                 headless=self.headless,
-                args=[
-                    '--no-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-extensions',
-                    '--disable-plugins',
-                    '--disable-images',  # 画像読み込み無効化で高速化
-                ]
+                args=list(BROWSER_LAUNCH_ARGS)
             )
             
-            self.context = await self.browser.new_context(
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                viewport={'width': 1280, 'height': 720},
-                java_script_enabled=True
-            )
+            self.context = await self.browser.new_context(**BROWSER_CONTEXT_OPTIONS)
+            
+            # 画像・動画・フォントはテキスト抽出に不要なため取得しない
+            await self.context.route("**/*", self._block_unneeded_resources)
             
             self.logger.info("Playwright browser started successfully")
             
         except Exception as e:
-            self.logger.error(f"Failed to start Playwright browser: {e}")
+            self.logger.error("Failed to start Playwright browser: %s", e)
             raise
             
+    async def _block_unneeded_resources(self, route):
+        """不要なリソースへのリクエストを中断し、それ以外は通常通り取得"""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+            
     async def close(self):
         """ブラウザを閉じる"""
         try:
@@ -89,7 +165,7 @@ class PlaywrightSearcher:
             self.logger.info("Playwright browser closed")
             
         except Exception as e:
-            self.logger.error(f"Error closing Playwright browser: {e}")
+            self.logger.error("Error closing Playwright browser: %s", e)
             
     async def search_ai_model_info(self, ai_service: str) -> Dict[str, Any]:
         """
@@ -101,59 +177,24 @@ class PlaywrightSearcher:
         Returns:
             最新モデル情報の辞書
         """
-        search_configs = {
-            "chatgpt": {
-                "urls": [
-                    "https://platform.openai.com/docs/models",
-                    "https://chat.openai.com"
-                ],
-                "search_terms": ["GPT-4", "GPT-4o", "GPT-4.1", "models", "latest"]
-            },
-            "claude": {
-                "urls": [
-                    "https://docs.anthropic.com/en/docs/about-claude/models",
-                    "https://claude.ai"
-                ],
-                "search_terms": ["Claude 3.5", "Sonnet", "Haiku", "models", "latest"]
-            },
-            "gemini": {
-                "urls": [
-                    "https://ai.google.dev/gemini-api/docs/models",
-                    "https://gemini.google.com"
-                ],
-                "search_terms": ["Gemini 2.0", "Flash", "Pro", "models", "latest"]
-            },
-            "perplexity": {
-                "urls": [
-                    "https://www.perplexity.ai",
-                    "https://docs.perplexity.ai"
-                ],
-                "search_terms": ["models", "Pro", "search modes", "latest"]
-            },
-            "genspark": {
-                "urls": [
-                    "https://genspark.ai",
-                    "https://www.genspark.ai"
-                ],
-                "search_terms": ["models", "Sparkpage", "features", "latest"]
-            }
-        }
-        
-        config = search_configs.get(ai_service.lower())
+        config = SEARCH_CONFIGS.get(ai_service.lower())
         if not config:
             raise ValueError(f"Unsupported AI service: {ai_service}")
             
         results = {}
         
-        for url in config["urls"]:
-            try:
-                page_info = await self._scrape_page(url, config["search_terms"])
-                if page_info:
-                    results[url] = page_info
-                    
-            except Exception as e:
-                self.logger.warning(f"Failed to scrape {url}: {e}")
+        # 各URLは別ページで独立して取得できるため並行してスクレイピング
+        page_infos = await asyncio.gather(
+            *(self._scrape_page(url, config["search_terms"]) for url in config["urls"]),
+            return_exceptions=True
+        )
+        
+        for url, page_info in zip(config["urls"], page_infos):
+            if isinstance(page_info, Exception):
+                self.logger.warning("Failed to scrape %s: %s", url, page_info)
                 continue
+            if page_info:
+                results[url] = page_info
                 
         return {
             "ai_service": ai_service,
@@ -177,7 +218,12 @@ class PlaywrightSearcher:
         try:
             # ページに移動
             await page.goto(url, wait_until='domcontentloaded', timeout=self.timeout)
-            await page.wait_for_timeout(2000)  # ページの読み込み待機
+
+            # 見出しの描画を待機（固定待機ではなく、描画され次第すぐに進む）
+            try:
+                await page.wait_for_selector('h1, h2, h3', timeout=CONTENT_READY_TIMEOUT)
+            except PlaywrightTimeoutError:
+                self.logger.debug("Heading not rendered within timeout: %s", url)
             
             # ページタイトルを取得
             title = await page.title()
@@ -201,7 +247,7 @@ class PlaywrightSearcher:
             }
             
         except Exception as e:
-            self.logger.error(f"Error scraping {url}: {e}")
+            self.logger.error("Error scraping %s: %s", url, e)
             return None
             
         finally:
@@ -218,19 +264,21 @@ class PlaywrightSearcher:
             # 検索キーワードに関連する段落を抽出
             paragraphs = page_text.split('\n')
             
+            # 小文字化は検索語・段落ともに1回だけ行う
+            lowered_terms = [term.lower() for term in search_terms]
+            
             for paragraph in paragraphs:
                 paragraph = paragraph.strip()
                 if len(paragraph) > 20:  # 短すぎる段落は除外
-                    for term in search_terms:
-                        if term.lower() in paragraph.lower():
-                            relevant_content.append(paragraph)
-                            break
+                    lowered_paragraph = paragraph.lower()
+                    if any(term in lowered_paragraph for term in lowered_terms):
+                        relevant_content.append(paragraph)
                             
             # 重複を除去し、最大10件に制限
             relevant_content = list(dict.fromkeys(relevant_content))[:10]
             
         except Exception as e:
-            self.logger.warning(f"Error extracting relevant content: {e}")
+            self.logger.warning("Error extracting relevant content: %s", e)
             
         return relevant_content
         
@@ -252,7 +300,7 @@ class PlaywrightSearcher:
                 model_info = await self._extract_genspark_models(page)
                 
         except Exception as e:
-            self.logger.warning(f"Error extracting model info from {url}: {e}")
+            self.logger.warning("Error extracting model info from %s: %s", url, e)
             
         return model_info
         
@@ -262,15 +310,16 @@ class PlaywrightSearcher:
         
         try:
             # モデル一覧のテーブルやリストを探す
-            model_elements = await page.query_selector_all('h2, h3, strong, .model-name, [data-model]')
+            # 要素ごとに往復せず、1回の呼び出しでテキストをまとめて取得
+            texts = await page.locator('h2, h3, strong, .model-name, [data-model]').all_inner_texts()
             
-            for element in model_elements[:20]:  # 最大20要素まで
-                text = await element.inner_text()
-                if any(keyword in text.lower() for keyword in ['gpt-4', 'gpt-3.5', 'turbo', 'o1']):
+            for text in texts[:20]:  # 最大20要素まで
+                lowered = text.lower()
+                if any(keyword in lowered for keyword in ('gpt-4', 'gpt-3.5', 'turbo', 'o1')):
                     models[text.strip()] = {"detected": True}
                     
         except Exception as e:
-            self.logger.debug(f"Error extracting OpenAI models: {e}")
+            self.logger.debug("Error extracting OpenAI models: %s", e)
             
         return models
         
@@ -279,15 +328,16 @@ class PlaywrightSearcher:
         models = {}
         
         try:
-            model_elements = await page.query_selector_all('h2, h3, strong, .model-name')
+            # 要素ごとに往復せず、1回の呼び出しでテキストをまとめて取得
+            texts = await page.locator('h2, h3, strong, .model-name').all_inner_texts()
             
-            for element in model_elements[:20]:
-                text = await element.inner_text()
-                if any(keyword in text.lower() for keyword in ['claude', 'sonnet', 'haiku', 'opus']):
+            for text in texts[:20]:
+                lowered = text.lower()
+                if any(keyword in lowered for keyword in ('claude', 'sonnet', 'haiku', 'opus')):
                     models[text.strip()] = {"detected": True}
                     
         except Exception as e:
-            self.logger.debug(f"Error extracting Claude models: {e}")
+            self.logger.debug("Error extracting Claude models: %s", e)
             
         return models
         
@@ -296,15 +346,16 @@ class PlaywrightSearcher:
         models = {}
         
         try:
-            model_elements = await page.query_selector_all('h2, h3, strong, .model-name')
+            # 要素ごとに往復せず、1回の呼び出しでテキストをまとめて取得
+            texts = await page.locator('h2, h3, strong, .model-name').all_inner_texts()
             
-            for element in model_elements[:20]:
-                text = await element.inner_text()
-                if any(keyword in text.lower() for keyword in ['gemini', 'flash', 'pro', 'ultra']):
+            for text in texts[:20]:
+                lowered = text.lower()
+                if any(keyword in lowered for keyword in ('gemini', 'flash', 'pro', 'ultra')):
                     models[text.strip()] = {"detected": True}
                     
         except Exception as e:
-            self.logger.debug(f"Error extracting Gemini models: {e}")
+            self.logger.debug("Error extracting Gemini models: %s", e)
             
         return models
         
@@ -314,15 +365,16 @@ class PlaywrightSearcher:
         
         try:
             # Perplexity の場合はモード情報も含める
-            elements = await page.query_selector_all('h2, h3, strong, .feature-name')
+            # 要素ごとに往復せず、1回の呼び出しでテキストをまとめて取得
+            texts = await page.locator('h2, h3, strong, .feature-name').all_inner_texts()
             
-            for element in elements[:20]:
-                text = await element.inner_text()
-                if any(keyword in text.lower() for keyword in ['pro', 'search', 'research', 'mode']):
+            for text in texts[:20]:
+                lowered = text.lower()
+                if any(keyword in lowered for keyword in ('pro', 'search', 'research', 'mode')):
                     models[text.strip()] = {"detected": True}
                     
         except Exception as e:
-            self.logger.debug(f"Error extracting Perplexity models: {e}")
+            self.logger.debug("Error extracting Perplexity models: %s", e)
             
         return models
         
@@ -331,43 +383,49 @@ class PlaywrightSearcher:
         models = {}
         
         try:
-            elements = await page.query_selector_all('h2, h3, strong, .feature-name')
+            # 要素ごとに往復せず、1回の呼び出しでテキストをまとめて取得
+            texts = await page.locator('h2, h3, strong, .feature-name').all_inner_texts()
             
-            for element in elements[:20]:
-                text = await element.inner_text()
-                if any(keyword in text.lower() for keyword in ['sparkpage', 'agent', 'model', 'feature']):
+            for text in texts[:20]:
+                lowered = text.lower()
+                if any(keyword in lowered for keyword in ('sparkpage', 'agent', 'model', 'feature')):
                     models[text.strip()] = {"detected": True}
                     
         except Exception as e:
-            self.logger.debug(f"Error extracting Genspark models: {e}")
+            self.logger.debug("Error extracting Genspark models: %s", e)
             
         return models
         
-    async def batch_search_ai_services(self, ai_services: List[str]) -> Dict[str, Any]:
+    async def batch_search_ai_services(self, ai_services: List[str],
+                                       max_concurrency: int = MAX_CONCURRENT_SEARCHES) -> Dict[str, Any]:
         """
         複数のAIサービス情報を一括検索
         
         Args:
             ai_services: AIサービス名のリスト
+            max_concurrency: 同時に検索するAIサービス数の上限
             
         Returns:
             各AIサービスの情報を含む辞書
         """
-        results = {}
-        
-        for ai_service in ai_services:
-            try:
-                self.logger.info(f"Searching information for {ai_service}")
-                service_info = await self.search_ai_model_info(ai_service)
-                results[ai_service] = service_info
-                
-                # リクエスト間隔を空ける
-                await asyncio.sleep(1)
-                
-            except Exception as e:
-                self.logger.error(f"Failed to search {ai_service}: {e}")
-                results[ai_service] = {"error": str(e)}
-                
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1: {max_concurrency}")
+            
+        # 同時アクセス数を制限しつつ並行して検索
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _search(ai_service: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    self.logger.info("Searching information for %s", ai_service)
+                    return await self.search_ai_model_info(ai_service)
+                except Exception as e:
+                    self.logger.error("Failed to search %s: %s", ai_service, e)
+                    return {"error": str(e)}
+
+        service_infos = await asyncio.gather(*(_search(ai_service) for ai_service in ai_services))
+        results = dict(zip(ai_services, service_infos))
+
         return {
             "batch_search_results": results,
             "completed_at": datetime.now().isoformat()
@@ -383,41 +441,41 @@ class PlaywrightSearcher:
             with open(file_path, 'w', encoding='utf-8') as f:
                 json.dump(results, f, ensure_ascii=False, indent=2)
                 
-            self.logger.info(f"Search results saved to {file_path}")
+            self.logger.info("Search results saved to %s", file_path)
             return file_path
             
         except Exception as e:
-            self.logger.error(f"Failed to save search results: {e}")
+            self.logger.error("Failed to save search results: %s", e)
             return None
 
 
 # 同期ラッパー関数
-def search_ai_models_sync(ai_services: List[str], headless: bool = True) -> Dict[str, Any]:
+def search_ai_models_sync(ai_services: List[str], headless: bool = True,
+                          max_concurrency: int = MAX_CONCURRENT_SEARCHES) -> Dict[str, Any]:
     """
     同期版AI検索関数
     
     Args:
         ai_services: 検索するAIサービスのリスト
         headless: ヘッドレスモードで実行するか
+        max_concurrency: 同時に検索するAIサービス数の上限
         
     Returns:
         検索結果
     """
     async def _async_search():
         async with PlaywrightSearcher(headless=headless) as searcher:
-            return await searcher.batch_search_ai_services(ai_services)
+            return await searcher.batch_search_ai_services(ai_services, max_concurrency)
             
+    # 呼び出しごとに専用のイベントループを作成（uvloopがあれば使用）し、終了後に必ず閉じる
+    loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+    
     try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
-        
-    try:
         return loop.run_until_complete(_async_search())
     finally:
-        if loop.is_running():
-            loop.close()
+        asyncio.set_event_loop(None)
+        loop.close()
 
 
 if __name__ == "__main__":
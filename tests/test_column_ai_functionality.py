@@ -43,7 +43,7 @@ class TestColumnUtilities(unittest.TestCase):
         self.assertEqual(column_number_to_letter(26), "Z")
         self.assertEqual(column_number_to_letter(27), "AA")
         self.assertEqual(column_number_to_letter(28), "AB")
-    
+
     def test_copy_column_positions(self):
         """コピー列位置計算のテスト"""
         # 正常なケース
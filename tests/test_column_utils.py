@@ -0,0 +1,46 @@
+"""
+列ユーティリティのテスト
+
+src.utils.column_utils のみに依存し、シート関連モジュールなしで実行できる
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# プロジェクトルートをパスに追加
+sys.path.append(str(Path(__file__).parents[1]))
+
+from src.utils.column_utils import (
+    column_letter_to_number, column_number_to_letter, find_copy_columns_in_header
+)
+
+
+class TestColumnConversion(unittest.TestCase):
+    """列番号と列記号の変換テスト"""
+    
+    def test_column_conversion_wide_sheet(self):
+        """列記号テーブルの境界を跨ぐ変換テスト"""
+        self.assertEqual(column_number_to_letter(702), "ZZ")
+        self.assertEqual(column_number_to_letter(703), "AAA")
+        
+        # 往復変換で元の列番号に戻ること
+        for column_number in range(1, 1000):
+            letter = column_number_to_letter(column_number)
+            self.assertEqual(column_letter_to_number(letter), column_number)
+
+
+class TestFindCopyColumns(unittest.TestCase):
+    """ヘッダー行からのコピー列検出テスト"""
+    
+    def test_find_copy_columns_mixed_cells(self):
+        """空セル・数値・前後空白を含むヘッダー行からのコピー列検出テスト"""
+        header_row = [None, 1, " コピー ", "", 0, "コピー"]
+        copy_columns = find_copy_columns_in_header(header_row)
+        
+        expected = [(3, "C"), (6, "F")]
+        self.assertEqual(copy_columns, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+設定管理モジュールのテスト
+
+ConfigManager.save_config の一時ファイル経由の保存を検証
+"""
+
+import json
+import os
+import stat
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# プロジェクトルートをパスに追加
+sys.path.append(str(Path(__file__).parents[1]))
+
+from src.utils.config_manager import ConfigManager
+
+
+class TestConfigManagerSave(unittest.TestCase):
+    """設定ファイル保存のテスト"""
+    
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.config_dir = Path(self._tmp_dir.name)
+        self.config_path = self.config_dir / "settings.json"
+        self.manager = ConfigManager(str(self.config_path))
+    
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+    
+    def _leftover_temp_files(self):
+        return [p.name for p in self.config_dir.iterdir() if p.name.endswith(".tmp")]
+    
+    def test_save_replaces_file(self):
+        """保存成功時にファイルが新しい内容で置き換わること"""
+        self.manager.set("spreadsheet_url", "https://example.com/sheet")
+        self.assertTrue(self.manager.save_config())
+        
+        with open(self.config_path, encoding="utf-8") as f:
+            saved = json.load(f)
+        self.assertEqual(saved["spreadsheet_url"], "https://example.com/sheet")
+        self.assertEqual(self._leftover_temp_files(), [])
+    
+    def test_failed_save_keeps_previous_content(self):
+        """シリアライズできない値の保存失敗時に元の内容が残ること"""
+        original = self.config_path.read_text(encoding="utf-8")
+        
+        self.manager.set("invalid", object())
+        self.assertFalse(self.manager.save_config())
+        
+        self.assertEqual(self.config_path.read_text(encoding="utf-8"), original)
+        self.assertEqual(self._leftover_temp_files(), [])
+    
+    @unittest.skipIf(os.name == "nt", "POSIX のパーミッションが必要")
+    def test_save_preserves_file_mode(self):
+        """保存後も既存ファイルのパーミッションが維持されること"""
+        os.chmod(self.config_path, 0o644)
+        
+        self.manager.set("sheet_name", "Sheet1")
+        self.assertTrue(self.manager.save_config())
+        
+        self.assertEqual(stat.S_IMODE(os.stat(self.config_path).st_mode), 0o644)
+    
+    @unittest.skipIf(os.name == "nt", "POSIX のパーミッションが必要")
+    def test_new_file_follows_umask(self):
+        """新規作成した設定ファイルに umask が適用されること"""
+        new_path = self.config_dir / "new_settings.json"
+        old_umask = os.umask(0o027)
+        try:
+            manager = ConfigManager(str(new_path))
+        finally:
+            os.umask(old_umask)
+        
+        self.assertTrue(new_path.exists())
+        self.assertEqual(stat.S_IMODE(os.stat(new_path).st_mode), 0o640)
+        self.assertEqual(manager.get("sheet_name"), "")
+
+
+if __name__ == "__main__":
+    unittest.main()